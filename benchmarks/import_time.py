@@ -0,0 +1,131 @@
+"""Measure how long it takes to import the agent packages.
+
+Runs each module import in a fresh interpreter with `python -X importtime`,
+parses the per-module timings it prints to stderr and reports the total time
+and the slowest imports. Heavy dependencies should only be imported once an
+agent is actually built, so `--check` fails if any of them show up.
+
+Usage:
+    uv run python benchmarks/import_time.py
+    uv run python benchmarks/import_time.py --check specialized_agents.planning_agent
+"""
+
+import argparse
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+DEFAULT_MODULES = [
+    "computers",
+    "computers.utils",
+    "specialized_agents",
+    "specialized_agents.planning_agent",
+]
+
+# Top-level packages that must not be imported just by importing our modules
+HEAVY_DEPENDENCIES = {
+    "agents",
+    "dotenv",
+    "openai",
+    "pdfplumber",
+    "PIL",
+    "playwright",
+    "requests",
+}
+
+
+@dataclass
+class ImportTiming:
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(stderr: str) -> list[ImportTiming]:
+    """Parse the `-X importtime` report, e.g.
+
+    import time: self [us] | cumulative | imported package
+    import time:       123 |        456 |   encodings.aliases
+    """
+    timings = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        timings.append(
+            ImportTiming(
+                module=name.strip(),
+                self_us=int(fields[0]),
+                cumulative_us=int(fields[1]),
+                # Nested imports are indented by two spaces per level
+                depth=(len(name) - len(name.lstrip()) - 1) // 2,
+            )
+        )
+    return timings
+
+
+def run_importtime(code: str) -> list[ImportTiming]:
+    """Run `code` in a fresh interpreter and return its import timings."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        cwd=REPO_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Failed to run {code!r}:\n{result.stderr}")
+    return parse_importtime(result.stderr)
+
+
+def measure(module: str, startup: set[str]) -> list[ImportTiming]:
+    """Return the timings of the imports triggered by importing `module`.
+
+    Modules already imported during interpreter startup are left out.
+    """
+    return [t for t in run_importtime(f"import {module}") if t.module not in startup]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description="Measure how long it takes to import the agent packages."
+    )
+    parser.add_argument("modules", nargs="*", default=DEFAULT_MODULES)
+    parser.add_argument(
+        "--top", type=int, default=10, help="Number of slowest imports to show"
+    )
+    parser.add_argument(
+        "--check",
+        action="store_true",
+        help="Exit with an error if a heavy dependency is imported eagerly",
+    )
+    args = parser.parse_args()
+
+    startup = {t.module for t in run_importtime("pass")}
+    failed = False
+    for module in args.modules:
+        timings = measure(module, startup)
+        total_ms = sum(t.cumulative_us for t in timings if t.depth == 0) / 1000
+        print(f"{module}: {total_ms:.1f} ms ({len(timings)} modules imported)")
+
+        for timing in sorted(timings, key=lambda t: t.self_us, reverse=True)[
+            : args.top
+        ]:
+            print(f"  {timing.self_us / 1000:8.1f} ms  {timing.module}")
+
+        heavy = sorted({t.module.split(".")[0] for t in timings} & HEAVY_DEPENDENCIES)
+        if heavy:
+            print(f"  heavy dependencies imported: {', '.join(heavy)}")
+            failed = True
+
+    return 1 if args.check and failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,11 @@
-from . import contrib, default
+from typing import TYPE_CHECKING
+
 from .computer import Computer
-from .config import computers_config
+from .lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from . import contrib, default
+    from .config import computers_config
 
 __all__ = [
     "default",
@@ -8,3 +13,13 @@ __all__ = [
     "Computer",
     "computers_config",
 ]
+
+# Submodules that pull in Playwright and the Agents SDK are imported on first access
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "default": ".default",
+        "contrib": ".contrib",
+        "computers_config": ".config",
+    },
+)
@@ -1,3 +1,11 @@
-from .local_playwright import LocalPlaywrightBrowser
+from typing import TYPE_CHECKING
+
+from ..lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .local_playwright import LocalPlaywrightBrowser
 
 __all__ = ["LocalPlaywrightBrowser"]
+
+# Playwright and the Agents SDK are only imported once the browser is needed
+__getattr__ = lazy_getattr(__name__, {"LocalPlaywrightBrowser": ".local_playwright"})
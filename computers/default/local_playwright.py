@@ -1,6 +1,7 @@
 from agents import AsyncComputer
 from playwright.async_api import Browser, Page
 
+from ..screenshot_store import ScreenshotStore
 from ..shared.base_playwright import BasePlaywrightComputer
 
 
@@ -12,14 +13,16 @@ class LocalPlaywrightBrowser(BasePlaywrightComputer, AsyncComputer):
         debug_port: int = 9222,
         initial_url: str = "https://www.google.com",
         show_cursor: bool = True,
+        screenshot_store: ScreenshotStore | None = None,
     ):
         """Initialize the browser.
 
         Args:
             debug_port: Port for Chrome remote debugging
             initial_url: Initial URL to navigate to
+            screenshot_store: Where screenshots are written; defaults to a new store
         """
-        super().__init__(initial_url=initial_url)
+        super().__init__(initial_url=initial_url, screenshot_store=screenshot_store)
         self.debug_port = debug_port
         self.show_cursor = show_cursor
 
@@ -0,0 +1,23 @@
+import importlib
+import sys
+from typing import Any, Callable
+
+
+def lazy_getattr(package: str, exports: dict[str, str]) -> Callable[[str], Any]:
+    """Return a module `__getattr__` that imports `exports` on first access.
+
+    `exports` maps each exported name to the module that defines it, relative
+    to `package`. A name mapped to its own submodule (e.g. "default" to
+    ".default") exports the submodule itself.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in exports:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        module = importlib.import_module(exports[name], package)
+        value = module if exports[name] == f".{name}" else getattr(module, name)
+        # Cache the value so later lookups skip __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    return __getattr__
@@ -0,0 +1,190 @@
+import base64
+import hashlib
+import os
+import re
+import struct
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+DEFAULT_MAX_BYTES = 200 * 1024 * 1024
+DEFAULT_MAX_FRAMES = 1000
+
+PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+# Signature (8) + IHDR length (4) + "IHDR" (4) + width (4) + height (4)
+PNG_HEADER_SIZE = 24
+
+# Frames are named by their SHA-256 digest; any other file is left alone
+FRAME_NAME = re.compile(r"[0-9a-f]{64}\.png")
+
+
+def png_dimensions(header: bytes) -> tuple[int, int]:
+    """Return (width, height) read from the first 24 bytes of a PNG file."""
+    if header[:8] != PNG_SIGNATURE or header[12:16] != b"IHDR":
+        raise ValueError("Not a PNG image")
+    width, height = struct.unpack(">II", header[16:PNG_HEADER_SIZE])
+    return width, height
+
+
+def default_screenshot_dir() -> Path:
+    """$SCREENSHOT_DIR, or a directory in the user's cache dir."""
+    if os.getenv("SCREENSHOT_DIR"):
+        return Path(os.environ["SCREENSHOT_DIR"]).expanduser()
+    cache_dir = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_dir) / "unify-hackathon" / "screenshots"
+
+
+@dataclass(frozen=True)
+class ScreenshotHandle:
+    """Lightweight reference to a frame stored on disk by a ScreenshotStore."""
+
+    digest: str
+    path: Path
+    size: int
+    width: int
+    height: int
+
+    def read_bytes(self) -> bytes:
+        return self.path.read_bytes()
+
+    def to_base64(self) -> str:
+        """Encode the frame for the model API; avoid holding on to the result."""
+        return base64.b64encode(self.read_bytes()).decode("utf-8")
+
+
+class ScreenshotStore:
+    """Content-addressed, size-bounded ring buffer of PNG frames on disk.
+
+    Frames are written once to a `frames` subdirectory that the store owns,
+    named by their SHA-256 digest, so identical screenshots share a file. When
+    the store grows past `max_bytes` or `max_frames`, the least recently stored
+    frames are deleted. Frames left over from earlier sessions are kept for
+    debugging and count towards the same bounds; they are indexed on the first
+    `put` rather than when the store is opened. Files that the store did not
+    name are never indexed or deleted.
+
+    The index lives in memory, so the bounds only hold for a single process
+    using the directory. Give concurrent workers separate directories, or a
+    worker may delete frames another one still refers to.
+
+    Screenshots can show private pages such as the user's inbox, so the
+    directory and the frames in it are only accessible by the current user.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path | None = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_frames: int = DEFAULT_MAX_FRAMES,
+    ):
+        """Open (or create) a store.
+
+        Args:
+            directory: Where frames are written; defaults to $SCREENSHOT_DIR or
+                ~/.cache/unify-hackathon/screenshots
+            max_bytes: Maximum total size of the stored frames
+            max_frames: Maximum number of stored frames
+        """
+        self.directory = Path(directory or default_screenshot_dir())
+        self.frames_dir = self.directory / "frames"
+        self.max_bytes = max_bytes
+        self.max_frames = max_frames
+        self._frames: OrderedDict[str, ScreenshotHandle] = OrderedDict()
+        self._total_bytes = 0
+        self._loaded = False
+
+    def _load_existing(self) -> None:
+        if self._loaded:
+            return
+        self._loaded = True
+        self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.frames_dir.mkdir(mode=0o700, exist_ok=True)
+
+        paths = sorted(
+            (p for p in self.frames_dir.iterdir() if FRAME_NAME.fullmatch(p.name)),
+            key=lambda p: p.stat().st_mtime,
+        )
+        for path in paths:
+            try:
+                with path.open("rb") as f:
+                    width, height = png_dimensions(f.read(PNG_HEADER_SIZE))
+            except (OSError, ValueError):
+                continue
+            self._add(
+                ScreenshotHandle(
+                    digest=path.stem,
+                    path=path,
+                    size=path.stat().st_size,
+                    width=width,
+                    height=height,
+                )
+            )
+        self._evict()
+
+    def __len__(self) -> int:
+        self._load_existing()
+        return len(self._frames)
+
+    @property
+    def total_bytes(self) -> int:
+        self._load_existing()
+        return self._total_bytes
+
+    @property
+    def latest(self) -> ScreenshotHandle | None:
+        """The most recently stored frame, if any."""
+        self._load_existing()
+        return next(reversed(self._frames.values()), None)
+
+    def get(self, digest: str) -> ScreenshotHandle | None:
+        self._load_existing()
+        return self._frames.get(digest)
+
+    def put(self, png_bytes: bytes) -> ScreenshotHandle:
+        """Store a PNG frame and return a handle to it."""
+        self._load_existing()
+        digest = hashlib.sha256(png_bytes).hexdigest()
+        handle = self._frames.get(digest)
+        if handle is not None and handle.path.exists():
+            # Identical frame: mark it as recent instead of writing it again
+            self._frames.move_to_end(digest)
+            handle.path.touch()
+            return handle
+
+        width, height = png_dimensions(png_bytes[:PNG_HEADER_SIZE])
+        path = self.frames_dir / f"{digest}.png"
+        tmp_path = path.with_suffix(".tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as f:
+            f.write(png_bytes)
+        tmp_path.replace(path)
+
+        if handle is not None:
+            self._remove(digest)
+        handle = ScreenshotHandle(
+            digest=digest,
+            path=path,
+            size=len(png_bytes),
+            width=width,
+            height=height,
+        )
+        self._add(handle)
+        self._evict()
+        return handle
+
+    def _add(self, handle: ScreenshotHandle) -> None:
+        self._frames[handle.digest] = handle
+        self._total_bytes += handle.size
+
+    def _remove(self, digest: str) -> ScreenshotHandle:
+        handle = self._frames.pop(digest)
+        self._total_bytes -= handle.size
+        return handle
+
+    def _evict(self) -> None:
+        # Always keep the newest frame, even if it alone exceeds the bounds
+        while len(self._frames) > 1 and (
+            len(self._frames) > self.max_frames or self._total_bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._frames))
+            self._remove(oldest).path.unlink(missing_ok=True)
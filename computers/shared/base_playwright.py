@@ -5,6 +5,7 @@ from typing import List, Literal, cast
 
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
 
+from ..screenshot_store import ScreenshotHandle, ScreenshotStore
 from ..utils import check_blocklisted_url
 
 
@@ -112,13 +113,18 @@ class BasePlaywrightComputer:
         return (1024, 768)
 
     def __init__(
-        self, initial_url: str = "https://www.google.com", show_cursor: bool = True
+        self,
+        initial_url: str = "https://www.google.com",
+        show_cursor: bool = True,
+        screenshot_store: ScreenshotStore | None = None,
     ):
         self._playwright = None  # Will be initialized in __aenter__
         self._browser: Browser = None  # type: ignore[assignment]
         self._page: Page = None  # type: ignore[assignment]
         self.initial_url = initial_url
         self.show_cursor = show_cursor
+        self.screenshot_store = screenshot_store or ScreenshotStore()
+        self.last_screenshot: ScreenshotHandle | None = None
 
     async def __aenter__(self):
         # Start Playwright and call the subclass hook for getting browser/page
@@ -163,16 +169,30 @@ class BasePlaywrightComputer:
         return self._page.url
 
     # --- Common "Computer" actions ---
+    async def capture_screenshot(self) -> ScreenshotHandle:
+        """Capture only the viewport (not full_page) into the screenshot store."""
+        handle, _ = await self._capture_png()
+        return handle
+
     async def screenshot(self) -> str:
-        """Capture only the viewport (not full_page)."""
+        """Capture the viewport and return it base64 encoded for the model API."""
+        # Encode the bytes we already have rather than reading the frame back
+        _, png_bytes = await self._capture_png()
+        return base64.b64encode(png_bytes).decode("utf-8")
+
+    async def _capture_png(self) -> tuple[ScreenshotHandle, bytes]:
         print("Taking screenshot...")
         try:
             print("page:", self._page)
             png_bytes = await self._page.screenshot(
                 full_page=False, timeout=0, type="png"
             )
-            print(f"Screenshot taken, size: {len(png_bytes)} bytes")
-            return base64.b64encode(png_bytes).decode("utf-8")
+            self.last_screenshot = self.screenshot_store.put(png_bytes)
+            print(
+                f"Screenshot taken, size: {len(png_bytes)} bytes, "
+                f"saved to {self.last_screenshot.path}"
+            )
+            return self.last_screenshot, png_bytes
         except Exception as e:
             print(f"Screenshot failed: {e}")
             raise
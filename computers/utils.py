@@ -5,11 +5,7 @@ import os
 from io import BytesIO
 from urllib.parse import urlparse
 
-import requests
-from dotenv import load_dotenv
-from PIL import Image
-
-load_dotenv(override=True)
+from .screenshot_store import PNG_HEADER_SIZE, ScreenshotHandle, png_dimensions
 
 BLOCKED_DOMAINS = [
     "maliciousbook.com",
@@ -25,16 +21,33 @@ def pp(obj):
     print(json.dumps(obj, indent=4))
 
 
-def show_image(base_64_image):
-    image_data = base64.b64decode(base_64_image)
-    image = Image.open(BytesIO(image_data))
-    image.show()
+def show_image(image: ScreenshotHandle | str):
+    """Show a stored screenshot, or a base64 encoded image."""
+    from PIL import Image
+
+    if isinstance(image, ScreenshotHandle):
+        Image.open(image.path).show()
+        return
+    image_data = base64.b64decode(image)
+    Image.open(BytesIO(image_data)).show()
+
+
+def calculate_image_dimensions(image: ScreenshotHandle | str) -> tuple[int, int]:
+    """Return (width, height) of a stored screenshot or a base64 encoded image."""
+    if isinstance(image, ScreenshotHandle):
+        return image.width, image.height
 
+    # PNG dimensions live in the header, so only decode the first few bytes
+    header_chars = -(-PNG_HEADER_SIZE // 3) * 4
+    try:
+        return png_dimensions(base64.b64decode(image[:header_chars]))
+    except ValueError:
+        pass
 
-def calculate_image_dimensions(base_64_image):
-    image_data = base64.b64decode(base_64_image)
-    image = Image.open(io.BytesIO(image_data))
-    return image.size
+    from PIL import Image
+
+    image_data = base64.b64decode(image)
+    return Image.open(io.BytesIO(image_data)).size
 
 
 def sanitize_message(msg: dict) -> dict:
@@ -49,6 +62,12 @@ def sanitize_message(msg: dict) -> dict:
 
 
 def create_response(**kwargs):
+    import requests
+
+    from specialized_agents.config import load_config
+
+    load_config()
+
     url = "https://api.openai.com/v1/responses"
     headers = {
         "Authorization": f"Bearer {os.getenv('OPENAI_API_KEY')}",
@@ -1,10 +1,24 @@
-from dotenv import load_dotenv
+from typing import TYPE_CHECKING
 
-# Load environment variables once when the package is imported
-load_dotenv()
+from computers.lazy import lazy_getattr
+
+if TYPE_CHECKING:
+    from .computer_agent import build_computer_agent
+    from .planning_agent import build_planning_agent
+    from .research_agent import build_research_agent
 
 __all__ = [
     "build_computer_agent",
     "build_planning_agent",
     "build_research_agent",
 ]
+
+# Agent builders are imported on first access so importing the package stays cheap
+__getattr__ = lazy_getattr(
+    __name__,
+    {
+        "build_computer_agent": ".computer_agent",
+        "build_planning_agent": ".planning_agent",
+        "build_research_agent": ".research_agent",
+    },
+)
@@ -7,7 +7,7 @@ from agents import (
     function_tool,
 )
 
-from computers.default import LocalPlaywrightBrowser
+from specialized_agents.config import load_config
 from specialized_agents.constants import COMPUTER_MODEL
 
 
@@ -46,6 +46,9 @@ async def open_in_new_tab(ctx: RunContextWrapper, url: str) -> str:
 
 
 async def build_computer_agent() -> tuple[Agent, AsyncComputer]:
+    from computers.default import LocalPlaywrightBrowser
+
+    load_config()
     computer: AsyncComputer = LocalPlaywrightBrowser()
     await computer.__aenter__()
     computer_tool = ComputerTool(computer)
@@ -0,0 +1,18 @@
+_loaded = False
+
+
+def load_config() -> None:
+    """Load environment variables from `.env`.
+
+    This is the single place configuration is loaded; the `build_*_agent`
+    functions and `computers.utils.create_response` call it before talking to
+    the API. Calling it again is a no-op.
+    """
+    global _loaded
+    if _loaded:
+        return
+
+    from dotenv import load_dotenv
+
+    load_dotenv(override=True)
+    _loaded = True
@@ -5,6 +5,19 @@ COMPUTER_MODEL = "computer-use-preview"
 PLANNER_MAX_TURNS = 200
 TOOL_MAX_TURNS = 50
 
+# Agent tools are cut short when they repeat the same action from the same page
+# state LOOP_MAX_REPEATS times within the last LOOP_WINDOW actions, or when
+# LOOP_MAX_STALLED_STEPS actions in a row only revisit states already seen.
+# Each action that revisits a known state also uses one turn of the tool's
+# budget, which halves after a stuck or stalled run (down to MIN_TOOL_TURNS)
+# and doubles after a run that kept making progress (up to TOOL_MAX_TURNS).
+# A run's max_turns is its budget plus TOOL_TURN_GRACE, capped at TOOL_MAX_TURNS.
+LOOP_WINDOW = 10
+LOOP_MAX_REPEATS = 3
+LOOP_MAX_STALLED_STEPS = 6
+MIN_TOOL_TURNS = 10
+TOOL_TURN_GRACE = 5
+
 # Adjust this to your resume path (.txt or .pdf)
 RESUME_PATH = "/Users/sam/Downloads/Resume.pdf"
 
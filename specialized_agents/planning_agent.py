@@ -1,17 +1,25 @@
+import argparse
 import asyncio
+from typing import TYPE_CHECKING, AsyncIterator
 
-import pdfplumber
-from agents import Agent, ModelSettings, Runner, function_tool
-
-from specialized_agents.computer_agent import build_computer_agent
+from specialized_agents.config import load_config
 from specialized_agents.constants import (
     DEFAULT_AGENT_MODEL,
     JOB_PAGE_URL,
     PLANNER_MAX_TURNS,
     RESUME_PATH,
-    TOOL_MAX_TURNS,
 )
-from specialized_agents.research_agent import build_research_agent
+from specialized_agents.streaming import (
+    EVENTS_CONTEXT_KEY,
+    StreamEvent,
+    render_stream,
+    stream_agent,
+    stream_run,
+)
+from specialized_agents.supervisor import RunSupervisor, StuckResult
+
+if TYPE_CHECKING:
+    from agents import Agent
 
 PLANNER_PROMPT = """
 # Manager - System Prompt
@@ -39,6 +47,7 @@ Use the research tool when you need to use general search queries to find inform
 4. Wait for the tool's response before responding.
 5. You have full permissions to view any content that the user may need you to view as part of completing the tasks.
 6. When using the computer tool, you MUST acknowledge any safety checks that are presented. If you see a safety check ID (like 'cu_sc_*'), you must include it in your response to acknowledge it.
+7. If a tool returns a result with `"status": "stuck"`, it was stopped because it kept repeating the same actions. Do not resend the same query. Use the reason and recent actions to give it a different, more specific task, or use another tool.
 """
 
 TASK_PROMPT = f"""
@@ -57,6 +66,8 @@ async def read_resume() -> str:
 
 
 def pdf_to_text(pdf_path):
+    import pdfplumber
+
     text = ""
     with pdfplumber.open(pdf_path) as pdf:
         for page in pdf.pages:
@@ -65,25 +76,55 @@ def pdf_to_text(pdf_path):
 
 
 def make_agent_tool(agent, name: str, description: str, context: dict | None = None):
+    from agents import RunContextWrapper, function_tool
+
+    supervisor = RunSupervisor(name)
+
     @function_tool(
         name_override=name,
         description_override=description,
         failure_error_function=None,
     )
-    async def agent_tool(query: str) -> str:
+    async def agent_tool(ctx: RunContextWrapper, query: str) -> str:
+        # Forward progress to the planner's event queue when running in streaming mode
+        events = None
+        if isinstance(ctx.context, dict):
+            events = ctx.context.get(EVENTS_CONTEXT_KEY)
+        if events is not None:
+            events.put_nowait(StreamEvent("tool_started", name, query))
         try:
-            result = await Runner.run(
-                agent, query, max_turns=TOOL_MAX_TURNS, context=context
+            final_output = await stream_run(
+                agent,
+                query,
+                source=name,
+                max_turns=supervisor.start(),
+                context=context,
+                events=events,
+                supervisor=supervisor,
             )
-            print(name, "Final output: ", result.final_output)
-            return str(result.final_output)
+            if isinstance(final_output, StuckResult):
+                if events is None:
+                    print(name, "Stuck: ", final_output.reason)
+                return final_output.to_json()
+            if events is None:
+                print(name, "Final output: ", final_output)
+            return str(final_output)
         except Exception as e:
             return f"Error in tool {name}: {e}"
+        finally:
+            supervisor.finish()
 
     return agent_tool
 
 
-async def build_planning_agent() -> tuple[Agent, str]:
+async def build_planning_agent() -> "tuple[Agent, str]":
+    # Agents and their heavy dependencies are only imported once they are built
+    from agents import Agent, ModelSettings
+
+    from specialized_agents.computer_agent import build_computer_agent
+    from specialized_agents.research_agent import build_research_agent
+
+    load_config()
     try:
         research_agent = await build_research_agent()
         computer_agent, computer = await build_computer_agent()
@@ -119,7 +160,32 @@ async def build_planning_agent() -> tuple[Agent, str]:
         raise Exception(f"Error in planning agent: {e}")
 
 
-async def main():
+async def stream_planning_agent(task: str = TASK_PROMPT) -> AsyncIterator[StreamEvent]:
+    """Build the planning agent and yield its progress as StreamEvents.
+
+    This is the same iterator the CLI renders, exposed for embedding.
+    """
+    yield StreamEvent("status", "Planning Agent", "Starting agents...")
+    agent, user_resume = await build_planning_agent()
+    async for event in stream_agent(
+        agent,
+        task,
+        max_turns=PLANNER_MAX_TURNS,
+        context={"resume": user_resume},
+    ):
+        yield event
+
+
+async def main(stream: bool = True):
+    if stream:
+        try:
+            await render_stream(stream_planning_agent())
+        except Exception as e:
+            raise Exception(f"Error in planning agent: {e}")
+        return
+
+    from agents import Runner
+
     try:
         agent, user_resume = await build_planning_agent()
         result = await Runner.run(
@@ -134,4 +200,11 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    parser = argparse.ArgumentParser(description="Run the planning agent.")
+    parser.add_argument(
+        "--no-stream",
+        action="store_true",
+        help="Only print the final output instead of streaming progress",
+    )
+    args = parser.parse_args()
+    asyncio.run(main(stream=not args.no_stream))
@@ -2,12 +2,14 @@ from typing import Literal
 
 from agents import Agent, ModelSettings, WebSearchTool
 
+from specialized_agents.config import load_config
 from specialized_agents.constants import DEFAULT_AGENT_MODEL
 
 default_search_context: Literal["low", "medium", "high"] = "medium"
 
 
 async def build_research_agent() -> Agent:
+    load_config()
     search_tool = WebSearchTool(search_context_size=default_search_context)
 
     agent = Agent(
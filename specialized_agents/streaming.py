@@ -0,0 +1,222 @@
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, AsyncIterator, Literal
+
+if TYPE_CHECKING:
+    from agents import Agent
+
+    from computers.screenshot_store import ScreenshotHandle
+    from specialized_agents.supervisor import RunSupervisor
+
+# Context key used to hand the event queue from the planner to its agent tools
+EVENTS_CONTEXT_KEY = "events"
+
+StreamEventKind = Literal[
+    "status",
+    "token",
+    "tool_started",
+    "tool_finished",
+    "screenshot",
+    "message",
+    "final",
+    "error",
+]
+
+
+@dataclass
+class StreamEvent:
+    """A single incremental update from the planner or one of its sub-agents.
+
+    Attributes:
+        kind: What happened (a model token, a tool call starting, a screenshot, ...)
+        source: Name of the agent or tool that produced the event
+        text: Event payload; for screenshots, the frame's digest when it is
+            available from the screenshot store and its data URL otherwise
+        screenshot: Handle to the stored frame for screenshot events
+    """
+
+    kind: StreamEventKind
+    source: str
+    text: str = ""
+    screenshot: "ScreenshotHandle | None" = None
+
+
+def describe_tool_call(raw_item: Any) -> str:
+    """Return a short, human readable description of a tool call item."""
+    item_type = getattr(raw_item, "type", None)
+    if item_type == "function_call":
+        return f"{raw_item.name}({raw_item.arguments})"
+    if item_type == "computer_call":
+        action = raw_item.action
+        args = ", ".join(
+            f"{key}={value}"
+            for key, value in action.model_dump(exclude={"type"}).items()
+        )
+        return f"{action.type}({args})"
+    if item_type == "web_search_call":
+        return "web_search"
+    return str(item_type)
+
+
+def message_text(raw_item: Any) -> str:
+    """Concatenate the text parts of an output message item."""
+    return "".join(
+        part.text
+        for part in getattr(raw_item, "content", [])
+        if getattr(part, "type", None) == "output_text"
+    )
+
+
+def to_stream_events(
+    source: str, event: Any, tokens: bool = False, tool_calls: bool = True
+) -> list[StreamEvent]:
+    """Translate an Agents SDK stream event into zero or more StreamEvents.
+
+    When `tokens` is set, text deltas are forwarded as they are generated and
+    complete messages are skipped, since they would repeat the same text.
+
+    The SDK only emits tool call items once the tool has finished, so they are
+    reported right before the tool's output. Set `tool_calls` to False for
+    agents whose tools announce themselves when they start, like agent tools.
+    """
+    if event.type == "raw_response_event":
+        data = event.data
+        if tokens and getattr(data, "type", None) == "response.output_text.delta":
+            return [StreamEvent("token", source, data.delta)]
+        return []
+
+    if event.type == "agent_updated_stream_event":
+        return [StreamEvent("status", source, f"{event.new_agent.name} is running")]
+
+    if event.type != "run_item_stream_event":
+        return []
+
+    item = event.item
+    if event.name == "tool_called":
+        if not tool_calls:
+            return []
+        return [StreamEvent("tool_started", source, describe_tool_call(item.raw_item))]
+    if event.name == "tool_output":
+        output = item.output
+        if isinstance(output, str) and output.startswith("data:image/"):
+            return [StreamEvent("screenshot", source, output)]
+        return [StreamEvent("tool_finished", source, str(output))]
+    if event.name == "message_output_created" and not tokens:
+        return [StreamEvent("message", source, message_text(item.raw_item))]
+    return []
+
+
+async def stream_run(
+    agent: "Agent",
+    input: str,
+    *,
+    source: str,
+    max_turns: int,
+    context: Any = None,
+    events: "asyncio.Queue[StreamEvent | None] | None" = None,
+    tokens: bool = False,
+    tool_calls: bool = True,
+    supervisor: "RunSupervisor | None" = None,
+) -> Any:
+    """Run `agent` in streaming mode, forwarding its progress to `events`.
+
+    Returns the final output of the run, just like `Runner.run(...).final_output`.
+    If a `supervisor` is given and detects a loop, the run is cancelled and its
+    StuckResult is returned instead.
+    """
+    from agents import Runner
+
+    computer = context.get("computer") if isinstance(context, dict) else None
+    result = Runner.run_streamed(agent, input, max_turns=max_turns, context=context)
+    async for event in result.stream_events():
+        for update in to_stream_events(
+            source, event, tokens=tokens, tool_calls=tool_calls
+        ):
+            handle = getattr(computer, "last_screenshot", None)
+            if update.kind == "screenshot" and handle is not None:
+                # Refer to the frame on disk rather than passing its data URL around
+                update = StreamEvent("screenshot", source, handle.digest, handle)
+            if events is not None:
+                events.put_nowait(update)
+            if supervisor is None:
+                continue
+            stuck = supervisor.observe(update)
+            if stuck is not None:
+                result.cancel()
+                if events is not None:
+                    events.put_nowait(StreamEvent("status", source, stuck.reason))
+                return stuck
+    return result.final_output
+
+
+async def stream_agent(
+    agent: "Agent", input: str, *, max_turns: int, context: dict | None = None
+) -> AsyncIterator[StreamEvent]:
+    """Run `agent` and yield its tokens and its sub-agents' progress as they happen.
+
+    Agent tools built with `make_agent_tool` pick up the event queue from the run
+    context, so events from nested runs are interleaved with the planner's own.
+    The iterator ends with a single "final" or "error" event.
+    """
+    events: asyncio.Queue[StreamEvent | None] = asyncio.Queue()
+    run_context = {**(context or {}), EVENTS_CONTEXT_KEY: events}
+
+    async def run() -> None:
+        try:
+            final_output = await stream_run(
+                agent,
+                input,
+                source=agent.name,
+                max_turns=max_turns,
+                context=run_context,
+                events=events,
+                tokens=True,
+                # Agent tools send their own "tool_started" event when they begin
+                tool_calls=False,
+            )
+            events.put_nowait(StreamEvent("final", agent.name, str(final_output)))
+        except Exception as e:
+            events.put_nowait(StreamEvent("error", agent.name, str(e)))
+        finally:
+            events.put_nowait(None)
+
+    task = asyncio.create_task(run())
+    try:
+        while (event := await events.get()) is not None:
+            yield event
+    finally:
+        task.cancel()
+
+
+def _shorten(text: str, limit: int = 200) -> str:
+    text = " ".join(text.split())
+    return text if len(text) <= limit else text[: limit - 3] + "..."
+
+
+async def render_stream(events: AsyncIterator[StreamEvent]) -> str:
+    """Print events to stdout as they arrive and return the final output."""
+    streaming_tokens = False
+    async for event in events:
+        if event.kind == "token":
+            print(event.text, end="", flush=True)
+            streaming_tokens = True
+            continue
+        if streaming_tokens:
+            print()
+            streaming_tokens = False
+
+        if event.kind == "screenshot" and event.screenshot is not None:
+            print(
+                f"[{event.source}] screenshot ({event.screenshot.size // 1024} KB): "
+                f"{event.screenshot.path}"
+            )
+        elif event.kind == "screenshot":
+            print(f"[{event.source}] screenshot ({len(event.text) // 1024} KB)")
+        elif event.kind == "final":
+            print(f"[{event.source}] Final output:\n{event.text}")
+            return event.text
+        elif event.kind == "error":
+            raise Exception(event.text)
+        else:
+            print(f"[{event.source}] {event.kind}: {_shorten(event.text)}")
+    return ""
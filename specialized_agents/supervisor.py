@@ -0,0 +1,154 @@
+import hashlib
+import json
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+
+from specialized_agents.constants import (
+    LOOP_MAX_REPEATS,
+    LOOP_MAX_STALLED_STEPS,
+    LOOP_WINDOW,
+    MIN_TOOL_TURNS,
+    TOOL_MAX_TURNS,
+    TOOL_TURN_GRACE,
+)
+from specialized_agents.streaming import StreamEvent
+
+
+def _digest(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class StuckResult:
+    """Structured result returned to the planner when a sub-agent is cut short."""
+
+    tool: str
+    reason: str
+    steps: int
+    recent_actions: list[str] = field(default_factory=list)
+    status: str = "stuck"
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+class RunSupervisor:
+    """Watches a sub-agent's runs for no-progress loops and sizes its turn budget.
+
+    Each tool action is fingerprinted together with the state it was taken from,
+    where the state is a hash of the latest tool output (usually a screenshot).
+    A run is considered stuck when the same action is repeated from the same
+    state, or when several actions in a row only lead back to states that were
+    already seen. Hosted tools that report no output never form a state, so
+    they are not counted.
+
+    Actions that reach a new state are free, while every action that revisits
+    a known state draws one turn from the run's remaining budget; a run that
+    exhausts it is stuck too. The run itself may take at most the budget plus
+    a small grace margin in turns. Between runs the budget shrinks for a tool
+    whose last run got stuck or spent most of its budget without progress, and
+    grows back for one that kept making progress, even if it ran out of turns.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_turns: int = TOOL_MAX_TURNS,
+        min_turns: int = MIN_TOOL_TURNS,
+        window: int = LOOP_WINDOW,
+        max_repeats: int = LOOP_MAX_REPEATS,
+        max_stalled_steps: int = LOOP_MAX_STALLED_STEPS,
+        grace_turns: int = TOOL_TURN_GRACE,
+    ):
+        self.name = name
+        self.max_turns = max_turns
+        self.min_turns = min_turns
+        self.window = window
+        self.max_repeats = max_repeats
+        self.max_stalled_steps = max_stalled_steps
+        self.grace_turns = grace_turns
+        self.budget = max_turns
+        self._reset()
+
+    def _reset(self) -> None:
+        self._state: str | None = None
+        self._seen_states: set[str] = set()
+        self._recent: deque[tuple[str, str]] = deque(maxlen=self.window)
+        self._actions: deque[str] = deque(maxlen=self.window)
+        self._stalled_steps = 0
+        self._steps = 0
+        self._stuck_result: StuckResult | None = None
+        self.remaining = self.budget
+
+    def start(self) -> int:
+        """Reset per-run state and return the max_turns to run the agent with.
+
+        The limit follows the tool's budget, with a grace margin so that a run
+        making progress can keep going after a few stalled actions. Stalled
+        actions are charged against the budget by `observe` during the run.
+        """
+        self._reset()
+        return min(self.max_turns, self.budget + self.grace_turns)
+
+    @property
+    def stalled(self) -> bool:
+        """Whether the last run got stuck or spent most of its budget stalling."""
+        return self._stuck_result is not None or self.remaining < self.budget / 2
+
+    def finish(self) -> None:
+        """Adjust the turn budget based on the progress of the last run."""
+        if self.stalled:
+            self.budget = max(self.min_turns, self.budget // 2)
+        else:
+            self.budget = min(self.max_turns, self.budget * 2)
+
+    def observe(self, event: StreamEvent) -> StuckResult | None:
+        """Record a stream event and return a StuckResult if the run is looping."""
+        if event.kind == "tool_started":
+            return self._observe_action(event.text)
+        if event.kind in ("screenshot", "tool_finished"):
+            return self._observe_state(event.text)
+        return None
+
+    def _observe_action(self, action: str) -> StuckResult | None:
+        self._actions.append(action)
+        if self._state is None:
+            return None
+
+        self._steps += 1
+        step = (self._state, action)
+        self._recent.append(step)
+        if Counter(self._recent)[step] >= self.max_repeats:
+            return self._stuck(
+                f"repeated '{action}' {self.max_repeats} times without any change"
+            )
+        return None
+
+    def _observe_state(self, output: str) -> StuckResult | None:
+        state = _digest(output)
+        if state in self._seen_states:
+            self._stalled_steps += 1
+            self.remaining -= 1
+        else:
+            self._stalled_steps = 0
+            self._seen_states.add(state)
+        self._state = state
+
+        if self._stalled_steps >= self.max_stalled_steps:
+            return self._stuck(
+                f"no new state reached in the last {self._stalled_steps} actions"
+            )
+        if self.remaining <= 0:
+            return self._stuck(
+                f"spent its budget of {self.budget} turns on actions without progress"
+            )
+        return None
+
+    def _stuck(self, reason: str) -> StuckResult:
+        self._stuck_result = StuckResult(
+            tool=self.name,
+            reason=reason,
+            steps=self._steps,
+            recent_actions=list(self._actions),
+        )
+        return self._stuck_result
@@ -0,0 +1,149 @@
+import base64
+import os
+import stat
+import struct
+import zlib
+
+import pytest
+
+from computers.screenshot_store import ScreenshotStore, png_dimensions
+from computers.utils import calculate_image_dimensions
+
+
+def make_png(width: int, height: int, shade: int = 0) -> bytes:
+    """Build a small solid-color RGB PNG."""
+
+    def chunk(kind: bytes, data: bytes) -> bytes:
+        crc = zlib.crc32(kind + data)
+        return struct.pack(">I", len(data)) + kind + data + struct.pack(">I", crc)
+
+    rows = b"".join(b"\x00" + bytes([shade]) * width * 3 for _ in range(height))
+    return (
+        b"\x89PNG\r\n\x1a\n"
+        + chunk(b"IHDR", struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0))
+        + chunk(b"IDAT", zlib.compress(rows))
+        + chunk(b"IEND", b"")
+    )
+
+
+def test_png_dimensions_reads_the_header():
+    assert png_dimensions(make_png(1024, 768)[:24]) == (1024, 768)
+
+    with pytest.raises(ValueError):
+        png_dimensions(b"GIF89a" + b"\x00" * 18)
+
+
+def test_put_writes_owner_only_frames(tmp_path):
+    store = ScreenshotStore(tmp_path / "screenshots")
+
+    handle = store.put(make_png(4, 3))
+
+    assert handle.path.read_bytes() == make_png(4, 3)
+    assert (handle.width, handle.height) == (4, 3)
+    assert handle.to_base64() == base64.b64encode(make_png(4, 3)).decode()
+    assert stat.S_IMODE(os.stat(store.directory).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(store.frames_dir).st_mode) == 0o700
+    assert stat.S_IMODE(os.stat(handle.path).st_mode) == 0o600
+    assert store.latest == handle
+
+
+def test_identical_frames_are_stored_once_and_marked_recent(tmp_path):
+    store = ScreenshotStore(tmp_path, max_frames=2)
+    first = store.put(make_png(4, 3, shade=1))
+    store.put(make_png(4, 3, shade=2))
+
+    assert store.put(make_png(4, 3, shade=1)) == first
+    assert len(store) == 2
+    assert store.latest == first
+
+    # The re-touched frame survives eviction, the older one does not
+    third = store.put(make_png(4, 3, shade=3))
+    assert store.get(first.digest) == first
+    assert first.path.exists()
+    assert len(list(store.frames_dir.glob("*.png"))) == 2
+    assert store.latest == third
+
+
+def test_evicts_oldest_frames_by_count(tmp_path):
+    store = ScreenshotStore(tmp_path, max_frames=3)
+
+    handles = [store.put(make_png(4, 3, shade=i)) for i in range(5)]
+
+    assert len(store) == 3
+    assert [h.path.exists() for h in handles] == [False, False, True, True, True]
+    assert store.get(handles[0].digest) is None
+
+
+def test_evicts_oldest_frames_by_size(tmp_path):
+    frames = [make_png(4, 3, shade=i) for i in range(4)]
+    max_bytes = len(frames[2]) + len(frames[3])
+    store = ScreenshotStore(tmp_path, max_bytes=max_bytes)
+
+    handles = [store.put(frame) for frame in frames]
+
+    assert len(store) == 2
+    assert store.total_bytes == max_bytes
+    assert [h.path.exists() for h in handles] == [False, False, True, True]
+
+
+def test_keeps_the_newest_frame_even_if_it_exceeds_the_bounds(tmp_path):
+    store = ScreenshotStore(tmp_path, max_bytes=1)
+
+    handle = store.put(make_png(4, 3))
+
+    assert len(store) == 1
+    assert handle.path.exists()
+
+
+def test_reloads_frames_from_an_existing_directory(tmp_path):
+    store = ScreenshotStore(tmp_path)
+    handles = [store.put(make_png(4 + i, 3, shade=i)) for i in range(3)]
+    for i, handle in enumerate(handles):
+        os.utime(handle.path, (i, i))
+    (store.frames_dir / "notes.png").write_bytes(b"not a png")
+
+    reloaded = ScreenshotStore(tmp_path, max_frames=2)
+
+    assert len(reloaded) == 2
+    assert reloaded.get(handles[0].digest) is None
+    assert not handles[0].path.exists()
+    assert reloaded.get(handles[2].digest) == handles[2]
+    assert reloaded.latest == handles[2]
+
+
+def test_frames_are_indexed_on_first_put(tmp_path):
+    store = ScreenshotStore(tmp_path)
+    handles = [store.put(make_png(4, 3, shade=i)) for i in range(3)]
+
+    reopened = ScreenshotStore(tmp_path, max_frames=1)
+
+    # Opening the store does not scan or evict anything
+    assert all(handle.path.exists() for handle in handles)
+    reopened.put(make_png(4, 3, shade=9))
+    assert not any(handle.path.exists() for handle in handles)
+
+
+def test_foreign_files_are_never_indexed_or_evicted(tmp_path):
+    vacation = tmp_path / "vacation.png"
+    vacation.write_bytes(make_png(4, 3, shade=7))
+    store = ScreenshotStore(tmp_path, max_frames=1)
+    store.put(make_png(4, 3, shade=1))
+    foreign_frame = store.frames_dir / "vacation.png"
+    foreign_frame.write_bytes(make_png(4, 3, shade=8))
+
+    reopened = ScreenshotStore(tmp_path, max_frames=1)
+    reopened.put(make_png(4, 3, shade=2))
+    reopened.put(make_png(4, 3, shade=3))
+
+    assert len(reopened) == 1
+    assert vacation.exists()
+    assert foreign_frame.exists()
+
+
+def test_calculate_image_dimensions_from_handle_and_base64(tmp_path):
+    handle = ScreenshotStore(tmp_path).put(make_png(1024, 768))
+
+    assert calculate_image_dimensions(handle) == (1024, 768)
+    assert calculate_image_dimensions(handle.to_base64()) == (1024, 768)
+    # Only the header is decoded, so a truncated base64 string is enough
+    assert calculate_image_dimensions(handle.to_base64()[:32]) == (1024, 768)
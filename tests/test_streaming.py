@@ -0,0 +1,169 @@
+import asyncio
+import sys
+from pathlib import Path
+from types import ModuleType, SimpleNamespace
+
+import pytest
+
+from computers.screenshot_store import ScreenshotHandle
+from specialized_agents.streaming import (
+    StreamEvent,
+    render_stream,
+    stream_agent,
+    to_stream_events,
+)
+
+
+def raw_event(data_type: str, delta: str = "") -> SimpleNamespace:
+    return SimpleNamespace(
+        type="raw_response_event", data=SimpleNamespace(type=data_type, delta=delta)
+    )
+
+
+def item_event(name: str, **item) -> SimpleNamespace:
+    return SimpleNamespace(
+        type="run_item_stream_event", name=name, item=SimpleNamespace(**item)
+    )
+
+
+def function_call(name: str, arguments: str) -> SimpleNamespace:
+    return SimpleNamespace(type="function_call", name=name, arguments=arguments)
+
+
+def message(text: str) -> SimpleNamespace:
+    return SimpleNamespace(content=[SimpleNamespace(type="output_text", text=text)])
+
+
+async def collect(events) -> list[StreamEvent]:
+    return [event async for event in events]
+
+
+def test_text_deltas_become_tokens_only_when_requested():
+    event = raw_event("response.output_text.delta", "Hel")
+
+    assert to_stream_events("planner", event, tokens=True) == [
+        StreamEvent("token", "planner", "Hel")
+    ]
+    assert to_stream_events("planner", event) == []
+    assert to_stream_events("planner", raw_event("response.created"), True) == []
+
+
+def test_messages_are_skipped_when_streaming_tokens():
+    event = item_event("message_output_created", raw_item=message("Done"))
+
+    assert to_stream_events("computer", event) == [
+        StreamEvent("message", "computer", "Done")
+    ]
+    assert to_stream_events("planner", event, tokens=True) == []
+
+
+def test_tool_calls_describe_function_and_computer_actions():
+    function_event = item_event(
+        "tool_called", raw_item=function_call("navigate_to_url", '{"url": "x"}')
+    )
+    action = SimpleNamespace(
+        type="click", model_dump=lambda exclude: {"x": 1, "y": 2, "button": "left"}
+    )
+    computer_event = item_event(
+        "tool_called", raw_item=SimpleNamespace(type="computer_call", action=action)
+    )
+
+    assert to_stream_events("computer", function_event) == [
+        StreamEvent("tool_started", "computer", 'navigate_to_url({"url": "x"})')
+    ]
+    assert to_stream_events("computer", computer_event) == [
+        StreamEvent("tool_started", "computer", "click(x=1, y=2, button=left)")
+    ]
+    assert to_stream_events("planner", function_event, tool_calls=False) == []
+
+
+def test_tool_outputs_split_screenshots_from_text():
+    screenshot = item_event("tool_output", output="data:image/png;base64,AAAA")
+    text = item_event("tool_output", output="Page title")
+
+    assert to_stream_events("computer", screenshot) == [
+        StreamEvent("screenshot", "computer", "data:image/png;base64,AAAA")
+    ]
+    assert to_stream_events("computer", text) == [
+        StreamEvent("tool_finished", "computer", "Page title")
+    ]
+
+
+def test_agent_updates_become_status_events():
+    event = SimpleNamespace(
+        type="agent_updated_stream_event", new_agent=SimpleNamespace(name="Planner")
+    )
+
+    assert to_stream_events("Planner", event) == [
+        StreamEvent("status", "Planner", "Planner is running")
+    ]
+
+
+def test_render_stream_prints_events_and_returns_final_output(capsys):
+    handle = ScreenshotHandle("abc", Path("/tmp/abc.png"), 4096, 10, 10)
+
+    async def events():
+        yield StreamEvent("token", "planner", "Hello ")
+        yield StreamEvent("token", "planner", "world")
+        yield StreamEvent("tool_started", "computer", "click(x=1)")
+        yield StreamEvent("screenshot", "computer", "abc", handle)
+        yield StreamEvent("final", "planner", "All done")
+        yield StreamEvent("status", "planner", "never printed")
+
+    assert asyncio.run(render_stream(events())) == "All done"
+    assert capsys.readouterr().out.splitlines() == [
+        "Hello world",
+        "[computer] tool_started: click(x=1)",
+        "[computer] screenshot (4 KB): /tmp/abc.png",
+        "[planner] Final output:",
+        "All done",
+    ]
+
+
+def test_render_stream_raises_on_error():
+    async def events():
+        yield StreamEvent("error", "planner", "Max turns exceeded")
+
+    with pytest.raises(Exception, match="Max turns exceeded"):
+        asyncio.run(render_stream(events()))
+
+
+class FakeStreamedResult:
+    def __init__(self, events, final_output):
+        self._events = events
+        self.final_output = final_output
+
+    async def stream_events(self):
+        for event in self._events:
+            yield event
+
+    def cancel(self):
+        pass
+
+
+def test_stream_agent_leaves_tool_starts_to_agent_tools(monkeypatch):
+    # The SDK reports the planner's tool calls only after they finish, so the
+    # planner must not emit its own late "tool_started" events
+    class FakeRunner:
+        @staticmethod
+        def run_streamed(agent, input, max_turns, context):
+            assert "events" in context
+            events = [
+                raw_event("response.output_text.delta", "Planning"),
+                item_event("tool_called", raw_item=function_call("computer", "go")),
+                item_event("tool_output", output="Went"),
+            ]
+            return FakeStreamedResult(events, "Done")
+
+    agents = ModuleType("agents")
+    agents.Runner = FakeRunner  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "agents", agents)
+
+    agent = SimpleNamespace(name="Planner")
+    events = asyncio.run(collect(stream_agent(agent, "task", max_turns=5)))  # type: ignore[arg-type]
+
+    assert events == [
+        StreamEvent("token", "Planner", "Planning"),
+        StreamEvent("tool_finished", "Planner", "Went"),
+        StreamEvent("final", "Planner", "Done"),
+    ]
@@ -0,0 +1,123 @@
+import json
+
+from specialized_agents.constants import (
+    LOOP_MAX_REPEATS,
+    LOOP_MAX_STALLED_STEPS,
+    MIN_TOOL_TURNS,
+    TOOL_MAX_TURNS,
+    TOOL_TURN_GRACE,
+)
+from specialized_agents.streaming import StreamEvent
+from specialized_agents.supervisor import RunSupervisor, StuckResult
+
+
+def step(supervisor: RunSupervisor, action: str, screenshot: str) -> StuckResult | None:
+    """Feed one computer action and the screenshot it produced."""
+    return supervisor.observe(
+        StreamEvent("tool_started", "computer", action)
+    ) or supervisor.observe(StreamEvent("screenshot", "computer", screenshot))
+
+
+def test_same_action_from_same_state_is_stuck():
+    supervisor = RunSupervisor("computer")
+    supervisor.start()
+    step(supervisor, "screenshot()", "page")
+
+    results = [step(supervisor, "click(x=1)", "page") for _ in range(LOOP_MAX_REPEATS)]
+
+    assert results[:-1] == [None] * (LOOP_MAX_REPEATS - 1)
+    stuck = results[-1]
+    assert stuck is not None
+    assert stuck.tool == "computer"
+    assert "click(x=1)" in stuck.reason
+    assert json.loads(stuck.to_json())["status"] == "stuck"
+
+
+def test_revisiting_known_states_is_stuck():
+    supervisor = RunSupervisor("computer")
+    supervisor.start()
+    step(supervisor, "screenshot()", "page a")
+    step(supervisor, "scroll(y=100)", "page b")
+
+    results = [
+        step(supervisor, f"scroll(y={i})", "page a" if i % 2 else "page b")
+        for i in range(LOOP_MAX_STALLED_STEPS)
+    ]
+
+    assert results[:-1] == [None] * (LOOP_MAX_STALLED_STEPS - 1)
+    stuck = results[-1]
+    assert stuck is not None
+    assert "no new state" in stuck.reason
+
+
+def test_progress_to_new_states_is_not_stuck():
+    supervisor = RunSupervisor("computer")
+    supervisor.start()
+
+    for i in range(3 * TOOL_MAX_TURNS):
+        assert step(supervisor, "scroll(y=100)", f"page {i}") is None
+
+    assert supervisor.remaining == supervisor.budget
+    assert not supervisor.stalled
+
+
+def test_hosted_tools_without_output_are_not_counted():
+    supervisor = RunSupervisor("research")
+    supervisor.start()
+
+    for _ in range(3 * TOOL_MAX_TURNS):
+        assert (
+            supervisor.observe(StreamEvent("tool_started", "research", "web_search"))
+            is None
+        )
+
+
+def test_scattered_stalls_spend_the_remaining_budget():
+    supervisor = RunSupervisor("computer", max_turns=4, min_turns=1)
+    supervisor.start()
+    step(supervisor, "screenshot()", "home")
+
+    stuck = None
+    for i in range(10):
+        # Alternate between a new page and going back home
+        stuck = step(supervisor, f"open(page={i})", f"page {i}") or step(
+            supervisor, "back()", "home"
+        )
+        if stuck:
+            break
+
+    assert stuck is not None
+    assert "budget" in stuck.reason
+    assert supervisor.remaining == 0
+
+
+def test_budget_shrinks_after_stuck_runs_down_to_the_minimum():
+    supervisor = RunSupervisor("computer")
+
+    caps = []
+    for _ in range(10):
+        caps.append(supervisor.start())
+        step(supervisor, "screenshot()", "page")
+        for _ in range(LOOP_MAX_REPEATS):
+            step(supervisor, "click(x=1)", "page")
+        supervisor.finish()
+
+    assert supervisor.budget == MIN_TOOL_TURNS
+    assert caps[0] == TOOL_MAX_TURNS
+    assert caps == sorted(caps, reverse=True)
+    assert supervisor.start() == MIN_TOOL_TURNS + TOOL_TURN_GRACE < TOOL_MAX_TURNS
+
+
+def test_budget_grows_after_progress_up_to_the_maximum():
+    supervisor = RunSupervisor("computer")
+    supervisor.budget = MIN_TOOL_TURNS
+
+    for run in range(10):
+        max_turns = supervisor.start()
+        # Keeps reaching new states until the SDK's max_turns stops it
+        for i in range(max_turns):
+            step(supervisor, "scroll(y=100)", f"run {run} page {i}")
+        supervisor.finish()
+
+    assert supervisor.budget == TOOL_MAX_TURNS
+    assert supervisor.start() == TOOL_MAX_TURNS